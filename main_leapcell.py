@@ -1,13 +1,47 @@
+import functools
 import hashlib
 import re
 import os
 import json
-from collections import Counter
+import threading
+import warnings
+from collections import Counter, OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from operator import itemgetter
+from typing import Annotated, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
+import orjson
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+from sortedcontainers import SortedKeyList
+
+# --- Hashing Backend ---
+# Every endpoint hashes its input, so SHA-256 must come from OpenSSL, which
+# dispatches to the CPU's SHA extensions (SHA-NI) when available. CPython
+# silently falls back to its portable builtin implementation when it was
+# built without OpenSSL; warn loudly at startup if that happened.
+try:
+    import _hashlib
+    SHA256_USES_OPENSSL = hashlib.sha256 is _hashlib.openssl_sha256
+except (ImportError, AttributeError):
+    SHA256_USES_OPENSSL = False
+
+if not SHA256_USES_OPENSSL:
+    try:
+        import ssl
+        backend = ssl.OPENSSL_VERSION
+    except ImportError:
+        backend = "no OpenSSL"
+    warnings.warn(
+        "hashlib.sha256 is not backed by OpenSSL "
+        f"({backend}); SHA-256 will run without hardware acceleration",
+        RuntimeWarning
+    )
 
 # --- Pydantic Models ---
 class StringProperties(BaseModel):
@@ -30,6 +64,15 @@ class CreateStringRequest(BaseModel):
     """The request body for the POST /strings endpoint."""
     value: str = Field(..., min_length=1)
 
+class CreateStringsBatchRequest(BaseModel):
+    """The request body for the POST /strings/batch endpoint."""
+    values: List[Annotated[str, Field(min_length=1)]] = Field(..., min_length=1, max_length=1000)
+
+class CreateStringsBatchResponse(BaseModel):
+    """The response for the POST /strings/batch endpoint."""
+    data: List[StoredString]
+    count: int
+
 class GetAllStringsResponse(BaseModel):
     """The response for the GET /strings (filtered list) endpoint."""
     data: List[StoredString]
@@ -42,122 +85,530 @@ class NLPFilterResponse(BaseModel):
     count: int
     interpreted_query: Dict[str, Union[str, Dict[str, Union[str, int, bool]]]]
 
+# --- Internal Representation ---
+@dataclass(slots=True, frozen=True)
+class StringRecord:
+    """Compact in-memory form of a stored string.
+
+    Pydantic models are only built at the API boundary. The frequency map and
+    the 32-byte presence bitmap computed during analysis are not kept here:
+    the map is serialized once, when the string is stored, and the bitmap
+    lives only in `string_columns`.
+    """
+    id: str
+    value: str
+    length: int
+    is_palindrome: bool
+    unique_characters: int
+    word_count: int
+    created_at: datetime
+
+    def to_model(self, character_frequency_map: Dict[str, int]) -> StoredString:
+        """Builds the StoredString response model for this record."""
+        properties = StringProperties.model_construct(
+            length=self.length,
+            is_palindrome=self.is_palindrome,
+            unique_characters=self.unique_characters,
+            word_count=self.word_count,
+            sha256_hash=self.id,
+            character_frequency_map=character_frequency_map
+        )
+        return StoredString.model_construct(
+            id=self.id,
+            value=self.value,
+            properties=properties,
+            created_at=self.created_at
+        )
+
+# --- Character Presence Bitmaps ---
+def character_presence(encoded: bytes) -> bytes:
+    """Builds a 32-byte bitmap with bit `b & 7` of byte `b >> 3` set for every byte `b` in `encoded`.
+
+    In UTF-8 an ASCII byte only ever encodes that ASCII character, so testing
+    an ASCII character against the bitmap is exact; non-ASCII characters must
+    be looked up in the string itself.
+    """
+    seen = np.bincount(np.frombuffer(encoded, dtype=np.uint8), minlength=256) > 0
+    return np.packbits(seen, bitorder='little').tobytes()
+
+def _is_ascii_char(char: str) -> bool:
+    return len(char) == 1 and char.isascii()
+
 # --- In-Memory Storage (for Leapcell deployment) ---
 # In production, you'd want to use a proper database
-stored_strings: Dict[str, StoredString] = {}
+# The store is capped so memory stays bounded under load: once it holds
+# MAX_STORED_STRINGS entries, the least recently used string is evicted.
+MAX_STORED_STRINGS = int(os.getenv("MAX_STORED_STRINGS", "100000"))
+stored_strings: "OrderedDict[str, StringRecord]" = OrderedDict()
+# Serialized JSON of each stored string, built once at insert time. Stored
+# strings never change, so list endpoints can stream these bytes as-is.
+stored_string_json: Dict[str, bytes] = {}
+# Count of stored values per built-in `hash()` (SipHash, cached on each str
+# object). Looking a value up here costs far less than SHA-256, so GET and
+# DELETE requests for values that were never stored skip hashing entirely.
+# Distinct values rarely share a hash, and when they do the SHA-256 lookup
+# still decides.
+stored_value_hashes: Dict[int, int] = defaultdict(int)
+# Endpoints run in a threadpool, so every read or write of the store and its
+# side tables (JSON cache, columns, indexes) happens under this lock. It is
+# reentrant because storing can evict through delete_string_from_db.
+store_lock = threading.RLock()
+
+class StringColumns:
+    """Column-oriented copy of the filterable properties of `stored_strings`.
+
+    Row `i` holds the properties of the string whose id is `ids[i]`, so a
+    filter pass is a handful of vectorized comparisons instead of a Python
+    loop over the stored records. Deleted rows are tombstoned and
+    reclaimed by `compact()` once they make up half of the table. Rows keep
+    insertion order, which list endpoints rely on, while `stored_strings`
+    itself is kept in LRU order.
+
+    Secondary indexes on is_palindrome, word_count and length let selective
+    queries visit only their candidate rows instead of the whole table.
+    """
+
+    INITIAL_CAPACITY = 1024
+    INT_MAX = np.iinfo(np.int64).max
+    COLUMNS = ("lengths", "word_counts", "is_palindrome", "char_presence", "alive")
+    # An index is only used when it narrows the scan to at most this share of
+    # the rows; beyond that one vectorized pass over everything is cheaper.
+    INDEX_MAX_FRACTION = 1 / 16
+
+    def __init__(self):
+        self.ids: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self.dead = 0
+        self.palindrome_ids: Set[str] = set()
+        self.ids_by_word_count: Dict[int, Set[str]] = defaultdict(set)
+        self.ids_by_length = SortedKeyList(key=itemgetter(0))
+        self.lengths = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self.word_counts = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self.is_palindrome = np.empty(self.INITIAL_CAPACITY, dtype=bool)
+        self.char_presence = np.zeros((self.INITIAL_CAPACITY, 32), dtype=np.uint8)
+        self.alive = np.zeros(self.INITIAL_CAPACITY, dtype=bool)
+
+    def _grow(self):
+        capacity = len(self.alive) * 2
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    def append(self, record: StringRecord, char_presence: bytes):
+        """Add a row for a newly stored string."""
+        row = len(self.ids)
+        if row == len(self.alive):
+            self._grow()
+        self.lengths[row] = record.length
+        self.word_counts[row] = record.word_count
+        self.is_palindrome[row] = record.is_palindrome
+        self.char_presence[row] = np.frombuffer(char_presence, dtype=np.uint8)
+        self.alive[row] = True
+        self.ids.append(record.id)
+        self.rows[record.id] = row
+        if record.is_palindrome:
+            self.palindrome_ids.add(record.id)
+        self.ids_by_word_count[record.word_count].add(record.id)
+        self.ids_by_length.add((record.length, record.id))
+
+    def remove(self, string_id: str):
+        """Tombstone the row of a deleted string."""
+        row = self.rows.pop(string_id)
+        self.palindrome_ids.discard(string_id)
+        word_count_ids = self.ids_by_word_count[int(self.word_counts[row])]
+        word_count_ids.discard(string_id)
+        if not word_count_ids:
+            del self.ids_by_word_count[int(self.word_counts[row])]
+        self.ids_by_length.remove((int(self.lengths[row]), string_id))
+        self.alive[row] = False
+        self.ids[row] = None
+        self.dead += 1
+        if self.dead * 2 > len(self.ids):
+            self.compact()
+
+    def compact(self):
+        """Drop tombstoned rows, preserving the order of the live ones."""
+        live = np.flatnonzero(self.alive[:len(self.ids)])
+        count = len(live)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[:count] = column[live]
+            column[count:] = 0
+        self.ids = [self.ids[row] for row in live]
+        self.rows = {string_id: row for row, string_id in enumerate(self.ids)}
+        self.dead = 0
+
+    def match(
+        self,
+        is_palindrome: Optional[bool] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        word_count: Optional[int] = None,
+        contains_any: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Return the ids of live rows matching every given filter, in insertion order.
+
+        `contains_any` keeps rows containing at least one of the given ASCII characters.
+        """
+        candidates = self._candidate_rows(is_palindrome, min_length, max_length, word_count)
+        rows = slice(0, len(self.ids)) if candidates is None else candidates
+        
+        mask = self.alive[rows].copy()
+        if is_palindrome is not None:
+            mask &= self.is_palindrome[rows] == is_palindrome
+        if min_length is not None:
+            mask &= self.lengths[rows] >= min(min_length, self.INT_MAX)
+        if max_length is not None:
+            mask &= self.lengths[rows] <= min(max_length, self.INT_MAX)
+        if word_count is not None:
+            mask &= self.word_counts[rows] == min(word_count, self.INT_MAX)
+        if contains_any is not None:
+            found = np.zeros(len(mask), dtype=bool)
+            for char in contains_any:
+                code = ord(char)
+                found |= (self.char_presence[rows, code >> 3] >> (code & 7)) & 1 == 1
+            mask &= found
+        
+        matched = np.flatnonzero(mask) if candidates is None else candidates[mask]
+        return [self.ids[row] for row in matched]
+
+    def _candidate_rows(
+        self,
+        is_palindrome: Optional[bool],
+        min_length: Optional[int],
+        max_length: Optional[int],
+        word_count: Optional[int]
+    ) -> Optional[np.ndarray]:
+        """Return the sorted rows of the most selective applicable index, or None for a full scan."""
+        best: Optional[Iterable[str]] = None
+        best_size = len(self.rows) * self.INDEX_MAX_FRACTION
+        
+        if is_palindrome and len(self.palindrome_ids) <= best_size:
+            best, best_size = self.palindrome_ids, len(self.palindrome_ids)
+        
+        if word_count is not None:
+            word_count_ids = self.ids_by_word_count.get(word_count, ())
+            if len(word_count_ids) <= best_size:
+                best, best_size = word_count_ids, len(word_count_ids)
+        
+        if min_length is not None or max_length is not None:
+            start = 0 if min_length is None else self.ids_by_length.bisect_key_left(min_length)
+            stop = (
+                len(self.ids_by_length) if max_length is None
+                else self.ids_by_length.bisect_key_right(max_length)
+            )
+            if max(stop - start, 0) <= best_size:
+                best = [string_id for _, string_id in self.ids_by_length.islice(start, stop)]
+        
+        if best is None:
+            return None
+        rows = np.fromiter((self.rows[string_id] for string_id in best), dtype=np.intp)
+        rows.sort()
+        return rows
+
+string_columns = StringColumns()
 
 # --- Helper Functions ---
-def store_string_in_db(stored_string: StoredString):
-    """Store a string in memory."""
-    stored_strings[stored_string.id] = stored_string
+def dump_json(content) -> bytes:
+    """Serializes `content` with orjson, falling back to the standard library.
 
-def get_string_from_db(string_value: str) -> Optional[StoredString]:
-    """Retrieve a string from memory by its value."""
-    sha256_hash = hashlib.sha256(string_value.encode('utf-8')).hexdigest()
-    return stored_strings.get(sha256_hash)
+    orjson rejects integers outside the 64-bit range (e.g. an oversized
+    `min_length` echoed back in `filters_applied`); those rare payloads are
+    rendered by `json` instead.
+    """
+    try:
+        return orjson.dumps(content)
+    except TypeError:
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
 
-def delete_string_from_db(string_value: str) -> bool:
-    """Delete a string from memory."""
-    sha256_hash = hashlib.sha256(string_value.encode('utf-8')).hexdigest()
-    if sha256_hash in stored_strings:
-        del stored_strings[sha256_hash]
-        return True
-    return False
+def store_string_in_db(
+    record: StringRecord, character_frequency_map: Dict[str, int], char_presence: bytes
+):
+    """Store a string in memory, evicting the least recently used one if full.
+
+    `character_frequency_map` and `char_presence` are computed by
+    `analyze_string`; the map is only serialized into `stored_string_json`
+    and the bitmap only copied into `string_columns`, neither is kept on the
+    record.
+    """
+    stored_strings[record.id] = record
+    stored_value_hashes[hash(record.value)] += 1
+    stored_string_json[record.id] = dump_json(
+        record.to_model(character_frequency_map).model_dump(mode='json')
+    )
+    string_columns.append(record, char_presence)
+    while len(stored_strings) > MAX_STORED_STRINGS:
+        delete_string_from_db(next(iter(stored_strings)))
+
+def may_be_stored(string_value: str) -> bool:
+    """Cheap pre-check before hashing: False means the value is definitely not stored."""
+    return hash(string_value) in stored_value_hashes
+
+def get_string_from_db(sha256_hash: str) -> Optional[StringRecord]:
+    """Retrieve a string from memory by its (already computed) SHA-256 hash."""
+    record = stored_strings.get(sha256_hash)
+    if record is not None:
+        stored_strings.move_to_end(sha256_hash)
+    return record
+
+def delete_string_from_db(sha256_hash: str) -> bool:
+    """Delete a string from memory by its (already computed) SHA-256 hash.
+
+    Returns False if no such string was stored.
+    """
+    record = stored_strings.pop(sha256_hash, None)
+    if record is None:
+        return False
+    value_hash = hash(record.value)
+    stored_value_hashes[value_hash] -= 1
+    if not stored_value_hashes[value_hash]:
+        del stored_value_hashes[value_hash]
+    del stored_string_json[sha256_hash]
+    string_columns.remove(sha256_hash)
+    return True
 
-def get_all_strings_from_db() -> List[StoredString]:
-    """Get all strings from memory."""
-    return list(stored_strings.values())
+# Above this length a NumPy bincount counts ASCII characters faster than Counter.
+BINCOUNT_MIN_LENGTH = 512
 
-def analyze_string(input_str: str) -> StoredString:
-    """Computes all properties for a given string and returns a StoredString object."""
+# Characters compared at each end before the full palindrome check.
+PALINDROME_PROBE_LENGTH = 16
+
+def _is_palindrome(normalized_str: str) -> bool:
+    """Checks whether a (lowercased) string reads the same backwards.
+
+    Non-palindromes almost always differ near the ends, so a short probe of
+    the first characters against the last ones rejects them without copying
+    the string. Survivors compare the first half against the reversed second
+    half, which copies half as much as `s == s[::-1]`.
+    """
+    half = len(normalized_str) // 2
+    probe = min(half, PALINDROME_PROBE_LENGTH)
+    if normalized_str[:probe] != normalized_str[:-probe - 1:-1]:
+        return False
+    return normalized_str[:half] == normalized_str[:-half - 1:-1]
+
+def compute_properties(input_str: str) -> Tuple[int, bool, int, int, Dict[str, int]]:
+    """Computes the value-derived properties of a string.
+
+    Returns (length, is_palindrome, unique_characters, word_count,
+    character_frequency_map).
+    """
     
     # 1. Length
     length = len(input_str)
     
     # 2. Is Palindrome (case-insensitive)
     normalized_str = input_str.lower()
-    is_palindrome = normalized_str == normalized_str[::-1]
+    is_palindrome = _is_palindrome(normalized_str)
     
-    # 3. Unique Characters
-    unique_characters = len(set(input_str))
+    # 3. Character Frequency Map (case-sensitive, as per Counter's default)
+    if length > BINCOUNT_MIN_LENGTH and input_str.isascii():
+        # One byte per character, so a byte histogram is the character histogram.
+        # Keys are re-ordered by first occurrence to match Counter's output.
+        counts = np.bincount(
+            np.frombuffer(input_str.encode('ascii'), dtype=np.uint8), minlength=128
+        ).tolist()
+        present = sorted(
+            (code for code, count in enumerate(counts) if count),
+            key=lambda code: input_str.find(chr(code))
+        )
+        character_frequency_map = {chr(code): counts[code] for code in present}
+    else:
+        character_frequency_map = dict(Counter(input_str))
     
-    # 4. Word Count
+    # 4. Unique Characters (one per frequency map key; no separate set pass)
+    unique_characters = len(character_frequency_map)
+    
+    # 5. Word Count
     word_count = len(input_str.split())
     
-    # 5. SHA-256 Hash
-    sha256_hash = hashlib.sha256(input_str.encode('utf-8')).hexdigest()
+    return length, is_palindrome, unique_characters, word_count, character_frequency_map
+
+def analyze_string(
+    input_str: str, encoded: bytes, sha256_hash: str
+) -> Tuple[StringRecord, Dict[str, int], bytes]:
+    """Computes all properties for a given string.
+
+    Returns the StringRecord, the character frequency map and the character
+    presence bitmap; the latter two are not part of the record and must be
+    handed to `store_string_in_db`.
+
+    The caller encodes and hashes the string once per request and passes both
+    in, so the SHA-256 digest is never computed twice for the same value.
+    """
     
-    # 6. Character Frequency Map (case-sensitive, as per Counter's default)
-    character_frequency_map = dict(Counter(input_str))
+    length, is_palindrome, unique_characters, word_count, character_frequency_map = (
+        compute_properties(input_str)
+    )
     
-    # Build the objects
-    properties = StringProperties(
+    record = StringRecord(
+        id=sha256_hash,
+        value=input_str,
         length=length,
         is_palindrome=is_palindrome,
         unique_characters=unique_characters,
         word_count=word_count,
-        sha256_hash=sha256_hash,
-        character_frequency_map=character_frequency_map
-    )
-    
-    stored_string = StoredString(
-        id=sha256_hash,
-        value=input_str,
-        properties=properties,
         created_at=datetime.now(timezone.utc)
     )
-    
-    return stored_string
+    return record, character_frequency_map, character_presence(encoded)
 
 def _apply_filters_to_list(
-    all_strings: List[StoredString],
     is_palindrome: Optional[bool] = None,
     min_length: Optional[int] = None,
     max_length: Optional[int] = None,
     word_count: Optional[int] = None,
-    contains_character: Optional[str] = None
-) -> List[StoredString]:
-    """Internal helper function to filter a list of StoredString objects."""
+    contains_character: Optional[str] = None,
+    match_case: bool = False
+) -> List[StringRecord]:
+    """Internal helper function to filter the stored strings.
+
+    All filters are evaluated as one vectorized mask over `string_columns`;
+    only the survivors are looked up in `stored_strings`. The character check
+    is case-insensitive unless `match_case` is set; it uses the presence
+    bitmaps whenever the characters are ASCII and falls back to searching the
+    values otherwise.
+    """
     
-    filtered_results = all_strings
+    candidates = None
+    ascii_candidates = None
+    if contains_character is not None:
+        if match_case:
+            candidates = (contains_character,)
+        else:
+            candidates = (contains_character.lower(), contains_character.upper())
+        # Case mapping can produce several characters (e.g. "ß".upper() == "SS"),
+        # which no single character of a value can equal.
+        candidates = tuple(char for char in candidates if len(char) == 1)
+        if not candidates:
+            return []
+        if all(_is_ascii_char(char) for char in candidates):
+            ascii_candidates = candidates
     
-    if is_palindrome is not None:
-        filtered_results = [
-            s for s in filtered_results if s.properties.is_palindrome == is_palindrome
-        ]
+    filtered_results = [
+        stored_strings[string_id]
+        for string_id in string_columns.match(
+            is_palindrome=is_palindrome,
+            min_length=min_length,
+            max_length=max_length,
+            word_count=word_count,
+            contains_any=ascii_candidates
+        )
+    ]
         
-    if min_length is not None:
+    if candidates is not None and ascii_candidates is None:
         filtered_results = [
-            s for s in filtered_results if s.properties.length >= min_length
+            s for s in filtered_results
+            if any(char in s.value for char in candidates)
         ]
+    
+    return filtered_results
 
-    if max_length is not None:
-        filtered_results = [
-            s for s in filtered_results if s.properties.length <= max_length
-        ]
+# --- Natural Language Query Parsing ---
+_PALINDROME_TOKENS = frozenset({"palindromic", "palindrome"})
+_SINGLE_WORD_TOKENS = frozenset({"single word", "one word"})
+
+# All value-carrying phrases are matched in a single scan; `lastgroup` names
+# the alternative that matched. The contained character is captured in a
+# lookahead so it can still start the next phrase.
+_NLP_PATTERN = re.compile(
+    r"longer than (?P<min_length>\d+) characters"
+    r"|containing the (?:letter|character) (?=(?P<contains_character>\w))"
+    r"|(?P<letter_z>letter z)"
+)
+
+@functools.lru_cache(maxsize=512)
+def _parse_nlp_query(query_lower: str) -> Tuple[Tuple[str, Union[str, int, bool]], ...]:
+    """Turns a lowercased natural language query into filter parameters.
+
+    "containing the letter X" wins over a bare "letter z", and "first vowel"
+    overrides both; only the first occurrence of each phrase counts. Clients
+    repeat the same few queries, so results are memoized; they are returned
+    as an immutable tuple of (filter, value) pairs for that reason.
+    """
+    parsed_filters = {}
+    
+    if any(token in query_lower for token in _PALINDROME_TOKENS):
+        parsed_filters["is_palindrome"] = True
         
-    if word_count is not None:
-        filtered_results = [
-            s for s in filtered_results if s.properties.word_count == word_count
-        ]
+    if any(token in query_lower for token in _SINGLE_WORD_TOKENS):
+        parsed_filters["word_count"] = 1
+    
+    matches = {}
+    for match in _NLP_PATTERN.finditer(query_lower):
+        matches.setdefault(match.lastgroup, match.group(match.lastgroup))
         
-    if contains_character is not None:
-        char_lower = contains_character.lower()
-        char_upper = contains_character.upper()
+    if "min_length" in matches:
+        parsed_filters["min_length"] = int(matches["min_length"]) + 1
         
-        filtered_results = [
-            s for s in filtered_results if 
-            (char_lower in s.properties.character_frequency_map) or 
-            (char_upper in s.properties.character_frequency_map)
-        ]
+    if "first vowel" in query_lower:
+        parsed_filters["contains_character"] = "a"
+    elif "contains_character" in matches:
+        parsed_filters["contains_character"] = matches["contains_character"].lower()
+    elif "letter_z" in matches:
+        parsed_filters["contains_character"] = "z"
     
-    return filtered_results
+    return tuple(parsed_filters.items())
 
 # --- FastAPI Application ---
+class FastJSONResponse(ORJSONResponse):
+    """Serializes with orjson (see `dump_json`), encoding nested dicts and datetimes in C."""
+
+    def render(self, content) -> bytes:
+        return dump_json(content)
+
+# Number of cached items joined into each chunk of a streamed list response.
+STREAM_CHUNK_SIZE = 256
+
+def string_json_response(string_id: str, status_code: int = status.HTTP_200_OK) -> Response:
+    """Returns the cached JSON of a single stored string."""
+    return Response(
+        content=stored_string_json[string_id],
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+def stream_string_list(
+    results: List[StringRecord],
+    status_code: int = status.HTTP_200_OK,
+    **fields
+) -> StreamingResponse:
+    """Streams `{"data": [...], "count": n, **fields}` from the cached per-string JSON.
+
+    The cached fragments are collected up front (call this under `store_lock`),
+    so the body is unaffected by writes made while it streams.
+    """
+    fragments = [stored_string_json[s.id] for s in results]
+    tail = dump_json({"count": len(fragments), **fields})
+    
+    def generate():
+        yield b'{"data":['
+        for start in range(0, len(fragments), STREAM_CHUNK_SIZE):
+            if start:
+                yield b','
+            yield b','.join(fragments[start:start + STREAM_CHUNK_SIZE])
+        yield b'],' + tail[1:]
+    
+    return StreamingResponse(generate(), status_code=status_code, media_type="application/json")
+
+# Endpoints are plain `def` functions, which FastAPI runs in AnyIO's worker
+# threadpool instead of on the event loop. A long analysis therefore no longer
+# stalls other requests, and hashlib releases the GIL while hashing large
+# inputs, so concurrent POSTs can hash on separate cores.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", min((os.cpu_count() or 1) * 2, 64)))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
 app = FastAPI(
     title="String Analyzer Service",
     description="Analyzes strings and stores their computed properties.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 # --- Endpoints ---
@@ -167,52 +618,119 @@ app = FastAPI(
     status_code=status.HTTP_201_CREATED,
     summary="Analyze and Store a String"
 )
-async def create_string(request: CreateStringRequest):
+def create_string(request: CreateStringRequest):
     """Analyzes a new string, computes its properties, and stores it."""
     value = request.value
+    encoded = value.encode('utf-8')
+    sha256_hash = hashlib.sha256(encoded).hexdigest()
+    conflict = HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="String already exists in the system"
+    )
     
     # Check if string already exists
-    existing_string = get_string_from_db(value)
+    with store_lock:
+        existing_string = get_string_from_db(sha256_hash)
     if existing_string:
+        raise conflict
+    
+    # Analyze outside the lock so concurrent requests can run in parallel,
+    # then re-check in case the same value was stored in the meantime.
+    analyzed_string, character_frequency_map, char_presence = analyze_string(
+        value, encoded, sha256_hash
+    )
+    with store_lock:
+        if get_string_from_db(sha256_hash):
+            raise conflict
+        store_string_in_db(analyzed_string, character_frequency_map, char_presence)
+        return string_json_response(analyzed_string.id, status_code=status.HTTP_201_CREATED)
+
+@app.post(
+    "/strings/batch",
+    response_model=CreateStringsBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Analyze and Store Several Strings"
+)
+def create_strings_batch(request: CreateStringsBatchRequest):
+    """Analyzes and stores several new strings at once; nothing is stored if any already exists."""
+    values = request.values
+    if len(set(values)) != len(values):
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="String already exists in the system"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch contains duplicate strings"
+        )
+    if len(values) > MAX_STORED_STRINGS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch is larger than the storage capacity"
+        )
+    conflict = HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="One or more strings already exist in the system"
+    )
+    
+    # Each value is encoded and hashed exactly once.
+    encoded_values = [value.encode('utf-8') for value in values]
+    hashes = [hashlib.sha256(encoded).hexdigest() for encoded in encoded_values]
+    
+    with store_lock:
+        if any(get_string_from_db(sha256_hash) for sha256_hash in hashes):
+            raise conflict
+    
+    analyzed_strings = [
+        analyze_string(value, encoded, sha256_hash)
+        for value, encoded, sha256_hash in zip(values, encoded_values, hashes)
+    ]
+    with store_lock:
+        if any(get_string_from_db(sha256_hash) for sha256_hash in hashes):
+            raise conflict
+        for analyzed_string, character_frequency_map, char_presence in analyzed_strings:
+            store_string_in_db(analyzed_string, character_frequency_map, char_presence)
+        return stream_string_list(
+            [analyzed_string for analyzed_string, _, _ in analyzed_strings],
+            status_code=status.HTTP_201_CREATED
         )
-        
-    analyzed_string = analyze_string(value)
-    store_string_in_db(analyzed_string)
-    return analyzed_string
 
 @app.get(
     "/strings/{string_value}",
     response_model=StoredString,
     summary="Get a Specific String"
 )
-async def get_string(string_value: str):
+def get_string(string_value: str):
     """Retrieves the analysis data for a specific string value."""
-    stored_string = get_string_from_db(string_value)
-    if not stored_string:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="String does not exist in the system"
-        )
-    return stored_string
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="String does not exist in the system"
+    )
+    if not may_be_stored(string_value):
+        raise not_found
+    
+    sha256_hash = hashlib.sha256(string_value.encode('utf-8')).hexdigest()
+    with store_lock:
+        stored_string = get_string_from_db(sha256_hash)
+        if not stored_string:
+            raise not_found
+        return string_json_response(stored_string.id)
 
 @app.delete(
     "/strings/{string_value}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a Specific String"
 )
-async def delete_string(string_value: str):
+def delete_string(string_value: str):
     """Deletes a specific string from the system."""
-    existing_string = get_string_from_db(string_value)
-    if not existing_string:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="String does not exist in the system"
-        )
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="String does not exist in the system"
+    )
+    if not may_be_stored(string_value):
+        raise not_found
     
-    delete_string_from_db(string_value)
+    sha256_hash = hashlib.sha256(string_value.encode('utf-8')).hexdigest()
+    with store_lock:
+        deleted = delete_string_from_db(sha256_hash)
+    if not deleted:
+        raise not_found
     return None
 
 @app.get(
@@ -220,7 +738,7 @@ async def delete_string(string_value: str):
     response_model=GetAllStringsResponse,
     summary="Get All Strings with Filtering"
 )
-async def get_all_strings(
+def get_all_strings(
     is_palindrome: Optional[bool] = Query(None),
     min_length: Optional[int] = Query(None, ge=0),
     max_length: Optional[int] = Query(None, ge=0),
@@ -242,52 +760,30 @@ async def get_all_strings(
         "contains_character": contains_character
     }
     
-    filtered_results = _apply_filters_to_list(
-        get_all_strings_from_db(),
-        is_palindrome=is_palindrome,
-        min_length=min_length,
-        max_length=max_length,
-        word_count=word_count,
-        contains_character=contains_character
-    )
+    with store_lock:
+        filtered_results = _apply_filters_to_list(
+            is_palindrome=is_palindrome,
+            min_length=min_length,
+            max_length=max_length,
+            word_count=word_count,
+            contains_character=contains_character
+        )
 
-    return {
-        "data": filtered_results,
-        "count": len(filtered_results),
-        "filters_applied": {k: v for k, v in filters_applied.items() if v is not None}
-    }
+        return stream_string_list(
+            filtered_results,
+            filters_applied={k: v for k, v in filters_applied.items() if v is not None}
+        )
 
 @app.get(
     "/strings/filter-by-natural-language",
     response_model=NLPFilterResponse,
     summary="Filter Strings with Natural Language"
 )
-async def filter_by_nlp(query: str = Query(..., description="The natural language query.")):
+def filter_by_nlp(query: str = Query(..., description="The natural language query.")):
     """Parses a simple natural language query to filter strings."""
     original_query = query
     query_lower = query.lower()
-    parsed_filters = {}
-    
-    # Simple Rule-Based NLP
-    if "palindromic" in query_lower or "palindrome" in query_lower:
-        parsed_filters["is_palindrome"] = True
-        
-    if "single word" in query_lower or "one word" in query_lower:
-        parsed_filters["word_count"] = 1
-        
-    longer_match = re.search(r"longer than (\d+) characters", query_lower)
-    if longer_match:
-        parsed_filters["min_length"] = int(longer_match.group(1)) + 1
-        
-    contains_match = re.search(r"containing the (?:letter|character) (\w)", query_lower)
-    if contains_match:
-        parsed_filters["contains_character"] = contains_match.group(1).lower()
-        
-    if "first vowel" in query_lower:
-        parsed_filters["contains_character"] = "a"
-        
-    if "letter z" in query_lower and "contains_character" not in parsed_filters:
-        parsed_filters["contains_character"] = "z"
+    parsed_filters = dict(_parse_nlp_query(query_lower))
         
     if not parsed_filters:
         raise HTTPException(
@@ -295,34 +791,25 @@ async def filter_by_nlp(query: str = Query(..., description="The natural languag
             detail="Unable to parse natural language query"
         )
         
-    filtered_results = get_all_strings_from_db()
-    
-    if "is_palindrome" in parsed_filters:
-        filtered_results = [s for s in filtered_results if s.properties.is_palindrome]
-        
-    if "word_count" in parsed_filters:
-        target_word_count = parsed_filters["word_count"]
-        filtered_results = [s for s in filtered_results if s.properties.word_count == target_word_count]
+    with store_lock:
+        filtered_results = _apply_filters_to_list(
+            is_palindrome=parsed_filters.get("is_palindrome"),
+            min_length=parsed_filters.get("min_length"),
+            word_count=parsed_filters.get("word_count"),
+            contains_character=parsed_filters.get("contains_character"),
+            match_case=True
+        )
 
-    if "min_length" in parsed_filters:
-        min_len = parsed_filters["min_length"]
-        filtered_results = [s for s in filtered_results if s.properties.length >= min_len]
-        
-    if "contains_character" in parsed_filters:
-        char = parsed_filters["contains_character"]
-        filtered_results = [s for s in filtered_results if char in s.properties.character_frequency_map]
-
-    return {
-        "data": filtered_results,
-        "count": len(filtered_results),
-        "interpreted_query": {
-            "original": original_query,
-            "parsed_filters": parsed_filters
-        }
-    }
+        return stream_string_list(
+            filtered_results,
+            interpreted_query={
+                "original": original_query,
+                "parsed_filters": parsed_filters
+            }
+        )
 
 @app.get("/", summary="Health Check")
-async def root():
+def root():
     """A simple health check endpoint to confirm the service is running."""
     return {"message": "String Analyzer Service is running on Leapcell!"}
 